@@ -9,34 +9,158 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import httpx
 import yaml
 from dotenv import load_dotenv
 
-# 加载 .env 文件
-load_dotenv()
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 未安装时降级为逐关键词扫描
+    ahocorasick = None
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # pybloom-live 未安装时降级为进程内 set（不跨次运行）
+    ScalableBloomFilter = None
+
+# .env 只在第一个采集器构造时加载一次，避免每次 import 都做文件 I/O
+_ENV_LOADED = False
+
+
+def _ensure_env() -> None:
+    """懒加载 .env 文件（进程内只执行一次）。"""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _ENV_LOADED = True
+
 
 # 项目根目录
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+# 中文字符匹配（语言检测用），C 级扫描代替逐字符 Python 循环
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+
+# KOL 等级 -> 互动分权重
+_KOL_MULT = {"S": 3.0, "A": 2.0, "B": 1.5}
+
+# 优先使用 libyaml C 解析器（比纯 Python SafeLoader 快 5-10 倍）
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# path -> (mtime, size, parsed_dict) 缓存，避免每次构造采集器都重新解析 YAML
+_YAML_CACHE: dict[str, tuple[float, int, dict]] = {}
+
+
+def _load_yaml_cached(path: Path) -> dict:
+    """
+    加载并缓存 YAML 文件，按 (mtime, size) 判断是否需要重新解析。
+
+    返回的是缓存中的同一个 dict，调用方约定只读不改。
+    """
+    key = str(path)
+    stat = os.stat(path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        return cached[2]
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    _YAML_CACHE[key] = (stat.st_mtime, stat.st_size, data)
+    return data
+
 
 def load_settings() -> dict:
-    """加载全局配置文件。"""
-    settings_path = PROJECT_ROOT / "config" / "settings.yaml"
-    with open(settings_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """加载全局配置文件（进程内缓存，视为只读）。"""
+    return _load_yaml_cached(PROJECT_ROOT / "config" / "settings.yaml")
 
 
 def load_kol_list() -> dict:
-    """加载 KOL 列表配置。"""
-    kol_path = PROJECT_ROOT / "config" / "kol_list.yaml"
-    with open(kol_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """加载 KOL 列表配置（进程内缓存，视为只读）。"""
+    return _load_yaml_cached(PROJECT_ROOT / "config" / "kol_list.yaml")
+
+
+# 进程内共享的 HTTP 客户端（懒构造）
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client(max_connections: int = 64) -> httpx.AsyncClient:
+    """
+    获取进程内共享的 httpx.AsyncClient。
+
+    所有采集器复用同一个连接池，跨数据源摊销 TCP+TLS 握手成本，
+    并通过 HTTP/2 在同一连接上多路复用并发请求。
+    连接池上限即全部数据源合计的在途请求上限
+    （对应 collection.max_concurrency 配置）；
+    平台相关的认证 / UA 头仍然按请求传入。
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max(max_connections // 2, 1),
+            ),
+            timeout=httpx.Timeout(30, connect=10),
+            headers={"User-Agent": "Get-LLM-News/1.0"},
+            follow_redirects=True,
+        )
+    return _shared_http_client
+
+
+async def aclose_http_client() -> None:
+    """关闭共享 HTTP 客户端（管道结束时调用）。"""
+    global _shared_http_client
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+
+
+# 跨次运行的已见内容 ID 过滤器（懒加载）。定时任务场景下大部分
+# 条目在上一轮就出现过，用它在解析 / 关键词扫描之前直接短路。
+_SEEN_IDS_PATH = PROJECT_ROOT / "data" / "seen_ids.bloom"
+_seen_ids = None
+
+
+def get_seen_ids():
+    """获取进程内共享的已见 ID 过滤器。
+
+    装了 pybloom-live 时是从磁盘加载的可扩容布隆过滤器
+    （~10 bit/条目，O(1) 查询）；否则降级为普通 set，只在
+    单次运行内生效。
+    """
+    global _seen_ids
+    if _seen_ids is None:
+        if ScalableBloomFilter is not None:
+            try:
+                with open(_SEEN_IDS_PATH, "rb") as f:
+                    _seen_ids = ScalableBloomFilter.fromfile(f)
+            except (OSError, ValueError):
+                _seen_ids = ScalableBloomFilter(
+                    initial_capacity=100_000, error_rate=1e-6
+                )
+        else:
+            _seen_ids = set()
+    return _seen_ids
+
+
+def save_seen_ids() -> None:
+    """将已见 ID 过滤器落盘（管道结束时调用）。"""
+    if _seen_ids is None or ScalableBloomFilter is None:
+        return
+    try:
+        _SEEN_IDS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_SEEN_IDS_PATH, "wb") as f:
+            _seen_ids.tofile(f)
+    except OSError as e:
+        logging.getLogger(__name__).debug(f"写入 seen_ids 失败: {e}")
 
 
 def get_all_keywords(settings: dict) -> list[str]:
@@ -48,7 +172,7 @@ def get_all_keywords(settings: dict) -> list[str]:
 
 
 def match_product(text: str, settings: dict) -> list[str]:
-    """匹配文本中提到的产品，返回产品名列表。"""
+    """匹配文本中提到的产品，返回产品名列表（逐关键词降级路径）。"""
     matched = []
     text_lower = text.lower()
     for product in settings.get("products", []):
@@ -59,7 +183,26 @@ def match_product(text: str, settings: dict) -> list[str]:
     return matched
 
 
-@dataclass
+def build_keyword_automaton(settings: dict):
+    """
+    将所有产品关键词编译为一个 Aho-Corasick 自动机。
+
+    每个词条的 payload 是对应的产品名，一次线性扫描即可同时完成
+    关键词过滤和产品标签匹配（代替 O(K·N) 的逐关键词 ``in`` 扫描）。
+    pyahocorasick 未安装时返回 None。
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for product in settings.get("products", []):
+        for keyword in product.get("keywords", []):
+            automaton.add_word(keyword.lower(), product["name"])
+    automaton.make_automaton()
+    return automaton
+
+
+@dataclass(slots=True)
 class NewsItem:
     """
     采集到的单条信息的标准数据结构。
@@ -88,20 +231,45 @@ class NewsItem:
 
     # 内部字段
     collected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    score: float = 0.0                  # finalize() 缓存的互动分，排序用
+    external_id: int | str | tuple = 0  # 平台原生 ID，采集器内部去重用
 
     def to_dict(self) -> dict:
-        """转为字典（JSON 序列化友好）。"""
-        d = asdict(self)
-        d["published_at"] = self.published_at.isoformat()
-        d["collected_at"] = self.collected_at.isoformat()
-        return d
+        """转为字典（JSON 序列化友好）。
+
+        手写字段映射，避免 dataclasses.asdict 的递归 deepcopy。
+        """
+        return {
+            "title": self.title,
+            "content": self.content,
+            "source": self.source,
+            "url": self.url,
+            "published_at": self.published_at.isoformat(),
+            "author": self.author,
+            "author_handle": self.author_handle,
+            "engagement": self.engagement,
+            "comments_count": self.comments_count,
+            "tags": list(self.tags),
+            "is_kol": self.is_kol,
+            "kol_tier": self.kol_tier,
+            "summary": self.summary,
+            "sentiment": self.sentiment,
+            "language": self.language,
+            "collected_at": self.collected_at.isoformat(),
+        }
 
     @property
     def engagement_score(self) -> float:
         """综合互动分数，用于排序。"""
         # KOL 加权
-        kol_multiplier = {"S": 3.0, "A": 2.0, "B": 1.5}.get(self.kol_tier, 1.0)
-        return (self.engagement + self.comments_count * 2) * kol_multiplier
+        return (self.engagement + self.comments_count * 2) * _KOL_MULT.get(
+            self.kol_tier, 1.0
+        )
+
+    def finalize(self) -> NewsItem:
+        """互动数据定型后缓存 score，排序时避免逐次比较都重算属性。"""
+        self.score = self.engagement_score
+        return self
 
     def __repr__(self) -> str:
         return (
@@ -117,12 +285,36 @@ class BaseCollector(ABC):
     所有平台采集器必须继承此类并实现 collect() 方法。
     """
 
-    def __init__(self, settings: dict, kol_config: dict):
+    def __init__(
+        self,
+        settings: dict,
+        kol_config: dict,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        _ensure_env()
+
         self.settings = settings
         self.kol_config = kol_config
         self.keywords = get_all_keywords(settings)
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # 共享 HTTP 客户端（可注入，默认取进程级单例）
+        self.http = http_client if http_client is not None else get_http_client()
+
+        # 所有关键词编译成一个自动机，过滤 + 打标签共用一次扫描
+        self._automaton = build_keyword_automaton(settings)
+
+        # 降级路径（pyahocorasick 缺失时）用的预先小写化关键词，
+        # 避免每次扫描都重复 kw.lower()
+        self._keywords_lower = tuple(kw.lower() for kw in self.keywords)
+        self._product_keywords = [
+            (p["name"], tuple(kw.lower() for kw in p.get("keywords", [])))
+            for p in settings.get("products", [])
+        ]
+
+        # 采集过程中即时去重用的 URL 集合（每次 collect() 开头重置）
+        self._seen_urls: set[str] = set()
+
         # 采集配置
         collection_cfg = settings.get("collection", {})
         self.lookback_days: int = collection_cfg.get("lookback_days", 1)
@@ -149,19 +341,100 @@ class BaseCollector(ABC):
         """
         ...
 
-    def filter_by_keywords(self, text: str) -> bool:
-        """检查文本是否包含任何关注的关键词。"""
-        text_lower = text.lower()
-        return any(kw.lower() in text_lower for kw in self.keywords)
+    def _add_unique(self, item: NewsItem, bucket: list[NewsItem]) -> bool:
+        """
+        URL 未出现过则把 item 追加进 bucket，在采集路径上即时去重。
+
+        代替采集完成后对完整列表的二次去重遍历。
+        """
+        if item.url in self._seen_urls:
+            return False
+        self._seen_urls.add(item.url)
+        bucket.append(item)
+        return True
+
+    async def _limited_get(self, client, url: str, limiter, **kwargs):
+        """经令牌桶限速器发起 GET 请求。
 
-    def tag_products(self, item: NewsItem) -> None:
-        """为 NewsItem 匹配产品标签。"""
-        text = f"{item.title} {item.content}"
-        item.tags = match_product(text, self.settings)
+        limiter 为 None（aiolimiter 未安装或端点未配置）时直接请求。
+        把请求压在 API 配额之内，避免突发打满后整窗口都在收 429。
+        """
+        if limiter is None:
+            return await client.get(url, **kwargs)
+        async with limiter:
+            return await client.get(url, **kwargs)
+
+    def _is_new_id(self, item_id) -> bool:
+        """跨次运行的内容 ID 去重。
+
+        首次见到该 ID 时记录并返回 True；重复出现返回 False，
+        调用方据此在关键词过滤和 NewsItem 构造之前短路。
+        """
+        key = str(item_id)
+        store = get_seen_ids()
+        if key in store:
+            return False
+        store.add(key)
+        return True
+
+    def filter_by_keywords(self, text: str, text_lower: str | None = None) -> bool:
+        """检查文本是否包含任何关注的关键词。
+
+        调用方若已持有小写化文本，可通过 text_lower 传入避免重复分配。
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        if self._automaton is not None:
+            # 一次线性扫描，命中即返回
+            return next(self._automaton.iter(text_lower), None) is not None
+        return any(kw in text_lower for kw in self._keywords_lower)
+
+    def scan_keywords(self, text: str, text_lower: str | None = None) -> list[str] | None:
+        """一次线性扫描同时完成关键词过滤和产品标签匹配。
+
+        命中返回去重后的产品名列表；一个关键词都没命中返回 None。
+        适合"过滤后立即打标签"的解析路径（Twitter/微博/知乎），
+        比 filter_by_keywords + tag_products 各扫一遍省掉一半扫描量。
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        if self._automaton is not None:
+            seen: set[str] = set()
+            tags: list[str] = []
+            for _, product_name in self._automaton.iter(text_lower):
+                if product_name not in seen:
+                    seen.add(product_name)
+                    tags.append(product_name)
+            return tags or None
+        tags = [
+            name
+            for name, keywords in self._product_keywords
+            if any(kw in text_lower for kw in keywords)
+        ]
+        return tags or None
+
+    def tag_products(self, item: NewsItem, text_lower: str | None = None) -> None:
+        """为 NewsItem 匹配产品标签（text_lower 同 filter_by_keywords）。"""
+        if text_lower is None:
+            text_lower = f"{item.title} {item.content}".lower()
+        if self._automaton is not None:
+            seen: set[str] = set()
+            tags: list[str] = []
+            for _, product_name in self._automaton.iter(text_lower):
+                if product_name not in seen:
+                    seen.add(product_name)
+                    tags.append(product_name)
+            item.tags = tags
+        else:
+            item.tags = [
+                name
+                for name, keywords in self._product_keywords
+                if any(kw in text_lower for kw in keywords)
+            ]
 
     def detect_language(self, text: str) -> str:
         """简单的语言检测（中文/英文）。"""
-        chinese_chars = sum(1 for c in text if "\u4e00" <= c <= "\u9fff")
+        chinese_chars = _CJK_RE.subn("", text)[1]
         return "zh" if chinese_chars > len(text) * 0.1 else "en"
 
     async def safe_collect(self) -> list[NewsItem]:
@@ -9,9 +9,13 @@ Hacker News 采集器。
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import operator
 from datetime import datetime, timedelta, timezone
 
 import httpx
+import orjson
 
 from .base import BaseCollector, NewsItem
 
@@ -27,6 +31,7 @@ class HackerNewsCollector(BaseCollector):
 
     async def collect(self) -> list[NewsItem]:
         items: list[NewsItem] = []
+        self._seen_urls = set()
 
         # HN 配置
         hn_config = self.kol_config.get("hackernews", {})
@@ -37,31 +42,38 @@ class HackerNewsCollector(BaseCollector):
         since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
         since_ts = int(since.timestamp())
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            for keyword in self.keywords:
-                try:
-                    results = await self._search(
-                        client, keyword, since_ts, min_score, search_tags
-                    )
-                    items.extend(results)
-                except Exception as e:
-                    self.logger.warning(f"搜索关键词 '{keyword}' 失败: {e}")
-
-                # 避免触发速率限制
-                if len(items) >= self.max_items:
-                    break
-
-        # 去重（按 URL）
-        seen_urls: set[str] = set()
-        unique_items: list[NewsItem] = []
+        # 关键词搜索相互独立，并发执行；信号量限流避免触发 Algolia 速率限制
+        sem = asyncio.Semaphore(8)
+
+        async def _bounded_search(keyword: str) -> list[NewsItem]:
+            async with sem:
+                return await self._search(
+                    self.http, keyword, since_ts, min_score, search_tags
+                )
+
+        results_list = await asyncio.gather(
+            *(_bounded_search(kw) for kw in self.keywords),
+            return_exceptions=True,
+        )
+
+        for keyword, result in zip(self.keywords, results_list):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"搜索关键词 '{keyword}' 失败: {result}")
+            else:
+                items.extend(result)
+
+        # 互动量 top N（URL 去重已在采集时完成）
+        # nlargest 为 O(n log k)，k=max_items 远小于候选数时省掉整列排序
         for item in items:
-            if item.url not in seen_urls:
-                seen_urls.add(item.url)
-                unique_items.append(item)
+            item.finalize()
+        top = heapq.nlargest(
+            self.max_items, items, key=operator.attrgetter("score")
+        )
 
-        # 按互动量排序，取 top N
-        unique_items.sort(key=lambda x: x.engagement_score, reverse=True)
-        return unique_items[: self.max_items]
+        # 只为最终进入结果的条目打产品标签，被截掉的不再扫描
+        for item in top:
+            self.tag_products(item)
+        return top
 
     async def _search(
         self,
@@ -89,7 +101,7 @@ class HackerNewsCollector(BaseCollector):
 
         resp = await client.get(f"{self.API_BASE}/search", params=params)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         for hit in data.get("hits", []):
             title = hit.get("title", "")
@@ -128,11 +140,9 @@ class HackerNewsCollector(BaseCollector):
                 language=self.detect_language(full_text),
             )
 
-            # 打产品标签
-            self.tag_products(news_item)
-            items.append(news_item)
+            self._add_unique(news_item, items)
 
         self.logger.debug(
-            f"关键词 '{query}' 搜索到 {len(items)} 条有效结果"
+            "关键词 '%s' 搜索到 %d 条有效结果", query, len(items)
         )
         return items
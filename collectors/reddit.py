@@ -9,13 +9,24 @@ Reddit 采集器。
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import operator
 import os
 from datetime import datetime, timedelta, timezone
 
 import httpx
+import orjson
 
 from .base import BaseCollector, NewsItem
 
+try:
+    import ijson
+except ImportError:  # ijson 未安装时退回一次性 orjson 解析
+    ijson = None
+
+_UTC = timezone.utc
+
 
 class RedditCollector(BaseCollector):
     """Reddit 采集器，支持 API 模式和公开 JSON 降级模式。"""
@@ -26,6 +37,7 @@ class RedditCollector(BaseCollector):
 
     async def collect(self) -> list[NewsItem]:
         items: list[NewsItem] = []
+        self._seen_urls = set()
 
         # Reddit 子版块配置
         reddit_config = self.kol_config.get("reddit", {})
@@ -34,22 +46,26 @@ class RedditCollector(BaseCollector):
         client_id = os.getenv("REDDIT_CLIENT_ID", "")
         client_secret = os.getenv("REDDIT_CLIENT_SECRET", "")
 
+        # 时间窗口只算一次，解析循环内复用
+        self._since = datetime.now(_UTC) - timedelta(days=self.lookback_days)
+
         if client_id and client_secret:
             items = await self._collect_with_api(subreddits, client_id, client_secret)
         else:
             self.logger.info("未配置 Reddit API Key，使用公开 JSON 端点（降级模式）")
             items = await self._collect_with_json(subreddits)
 
-        # 去重 + 排序
-        seen: set[str] = set()
-        unique: list[NewsItem] = []
+        # 互动量 top N（URL 去重已在采集时完成）
         for item in items:
-            if item.url not in seen:
-                seen.add(item.url)
-                unique.append(item)
+            item.finalize()
+        top = heapq.nlargest(
+            self.max_items, items, key=operator.attrgetter("score")
+        )
 
-        unique.sort(key=lambda x: x.engagement_score, reverse=True)
-        return unique[: self.max_items]
+        # 只为最终进入结果的条目打产品标签
+        for item in top:
+            self.tag_products(item)
+        return top
 
     async def _collect_with_api(
         self, subreddits: list[dict], client_id: str, client_secret: str
@@ -58,113 +74,125 @@ class RedditCollector(BaseCollector):
         items: list[NewsItem] = []
         user_agent = os.getenv("REDDIT_USER_AGENT", "Get-LLM-News/1.0")
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            # 获取 OAuth token
-            auth_resp = await client.post(
-                "https://www.reddit.com/api/v1/access_token",
-                auth=(client_id, client_secret),
-                data={"grant_type": "client_credentials"},
-                headers={"User-Agent": user_agent},
-            )
-            auth_resp.raise_for_status()
-            token = auth_resp.json()["access_token"]
-
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "User-Agent": user_agent,
-            }
-
-            for sub_info in subreddits:
-                sub_name = sub_info["name"]
-                try:
-                    results = await self._fetch_subreddit_api(
-                        client, headers, sub_name
-                    )
-                    items.extend(results)
-                except Exception as e:
-                    self.logger.warning(f"采集 r/{sub_name} 失败: {e}")
+        # 获取 OAuth token
+        auth_resp = await self.http.post(
+            "https://www.reddit.com/api/v1/access_token",
+            auth=(client_id, client_secret),
+            data={"grant_type": "client_credentials"},
+            headers={"User-Agent": user_agent},
+        )
+        auth_resp.raise_for_status()
+        token = orjson.loads(auth_resp.content)["access_token"]
+
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "User-Agent": user_agent,
+        }
+
+        # 每个子版块一次 /new 拉取，并发执行；信号量控制避免触发速率限制
+        sem = asyncio.Semaphore(4)
+
+        async def _bounded_fetch(sub_name: str) -> list[NewsItem]:
+            async with sem:
+                return await self._fetch_subreddit_api(self.http, headers, sub_name)
+
+        results = await asyncio.gather(
+            *(_bounded_fetch(s["name"]) for s in subreddits),
+            return_exceptions=True,
+        )
+
+        for sub_info, result in zip(subreddits, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"采集 r/{sub_info['name']} 失败: {result}")
+            else:
+                items.extend(result)
 
         return items
 
     async def _fetch_subreddit_api(
         self, client: httpx.AsyncClient, headers: dict, subreddit: str
     ) -> list[NewsItem]:
-        """通过 API 采集单个子版块的热帖。"""
+        """
+        通过 API 采集单个子版块的最新帖子。
+
+        一次 /new 批量拉取（limit=100）后在本地过关键词，
+        代替原来每个关键词一次搜索请求（10 倍的 HTTP 调用量）。
+        """
         items: list[NewsItem] = []
-        since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
-
-        # 搜索模式：在子版块内搜索关键词
-        for keyword in self.keywords[:10]:  # 限制搜索次数
-            params = {
-                "q": keyword,
-                "restrict_sr": "true",
-                "sort": "relevance",
-                "t": "day" if self.lookback_days <= 1 else "week",
-                "limit": 10,
-            }
-
-            resp = await client.get(
-                f"https://oauth.reddit.com/r/{subreddit}/search",
-                headers=headers,
-                params=params,
-            )
-
-            if resp.status_code != 200:
-                continue
-
-            data = resp.json()
-            for post in data.get("data", {}).get("children", []):
-                post_data = post.get("data", {})
-                item = self._parse_reddit_post(post_data, subreddit)
-                if item:
-                    items.append(item)
+
+        resp = await client.get(
+            f"https://oauth.reddit.com/r/{subreddit}/new",
+            headers=headers,
+            params={"limit": 100},
+        )
+
+        if resp.status_code != 200:
+            return items
+
+        # _parse_reddit_post 内部完成关键词 / 互动量 / 时间窗过滤
+        for post_data in self._iter_posts(resp.content):
+            item = self._parse_reddit_post(post_data, subreddit)
+            if item:
+                self._add_unique(item, items)
 
         return items
 
     async def _collect_with_json(self, subreddits: list[dict]) -> list[NewsItem]:
         """使用 Reddit 公开 JSON 端点（降级模式，无需 API Key）。"""
         items: list[NewsItem] = []
-        since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
-
-        async with httpx.AsyncClient(
-            timeout=30,
-            headers={"User-Agent": "Get-LLM-News/1.0"},
-            follow_redirects=True,
-        ) as client:
-            for sub_info in subreddits:
-                sub_name = sub_info["name"]
-                try:
-                    # 使用公开搜索端点
-                    for keyword in self.keywords[:8]:
-                        resp = await client.get(
-                            f"https://www.reddit.com/r/{sub_name}/search.json",
-                            params={
-                                "q": keyword,
-                                "restrict_sr": "on",
-                                "sort": "relevance",
-                                "t": "day" if self.lookback_days <= 1 else "week",
-                                "limit": 10,
-                            },
-                        )
-
-                        if resp.status_code != 200:
-                            self.logger.debug(
-                                f"r/{sub_name} 搜索 '{keyword}' 返回 {resp.status_code}"
-                            )
-                            continue
-
-                        data = resp.json()
-                        for post in data.get("data", {}).get("children", []):
-                            post_data = post.get("data", {})
-                            item = self._parse_reddit_post(post_data, sub_name)
-                            if item:
-                                items.append(item)
-
-                except Exception as e:
-                    self.logger.warning(f"采集 r/{sub_name} 失败: {e}")
+        sem = asyncio.Semaphore(4)
+
+        async def _bounded_fetch(sub_name: str) -> list[NewsItem]:
+            async with sem:
+                return await self._fetch_subreddit_json(sub_name)
+
+        results = await asyncio.gather(
+            *(_bounded_fetch(s["name"]) for s in subreddits),
+            return_exceptions=True,
+        )
+
+        for sub_info, result in zip(subreddits, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"采集 r/{sub_info['name']} 失败: {result}")
+            else:
+                items.extend(result)
 
         return items
 
+    async def _fetch_subreddit_json(self, subreddit: str) -> list[NewsItem]:
+        """通过公开 JSON 端点批量拉取单个子版块的最新帖子。"""
+        items: list[NewsItem] = []
+
+        resp = await self.http.get(
+            f"https://www.reddit.com/r/{subreddit}/new.json",
+            params={"limit": 100},
+        )
+
+        if resp.status_code != 200:
+            self.logger.debug("r/%s 拉取返回 %d", subreddit, resp.status_code)
+            return items
+
+        for post_data in self._iter_posts(resp.content):
+            item = self._parse_reddit_post(post_data, subreddit)
+            if item:
+                self._add_unique(item, items)
+
+        return items
+
+    @staticmethod
+    def _iter_posts(content: bytes):
+        """迭代 listing 响应中每个帖子的 data 对象。
+
+        limit=100 的 listing 约 500KB，且大部分是用不到的元数据。
+        装了 ijson 时只流式物化帖子对象本身，省掉整棵 JSON 树的构建；
+        否则退回 orjson 一次性解析。
+        """
+        if ijson is not None:
+            yield from ijson.items(content, "data.children.item.data")
+        else:
+            for post in orjson.loads(content).get("data", {}).get("children", []):
+                yield post.get("data", {})
+
     def _parse_reddit_post(
         self, post_data: dict, subreddit: str
     ) -> NewsItem | None:
@@ -172,9 +200,10 @@ class RedditCollector(BaseCollector):
         title = post_data.get("title", "")
         selftext = post_data.get("selftext", "")
         full_text = f"{title} {selftext}"
+        full_text_lower = full_text.lower()
 
         # 关键词过滤
-        if not self.filter_by_keywords(full_text):
+        if not self.filter_by_keywords(full_text, full_text_lower):
             return None
 
         # 互动量过滤
@@ -189,9 +218,8 @@ class RedditCollector(BaseCollector):
 
         # 时间过滤
         created_utc = post_data.get("created_utc", 0)
-        published_at = datetime.fromtimestamp(created_utc, tz=timezone.utc)
-        since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
-        if published_at < since:
+        published_at = datetime.fromtimestamp(created_utc, tz=_UTC)
+        if published_at < self._since:
             return None
 
         permalink = post_data.get("permalink", "")
@@ -210,5 +238,4 @@ class RedditCollector(BaseCollector):
             language=self.detect_language(full_text),
         )
 
-        self.tag_products(item)
         return item
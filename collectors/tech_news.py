@@ -14,16 +14,44 @@
 
 from __future__ import annotations
 
+import heapq
+import html
+import operator
 import re
+from calendar import timegm
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 
 import httpx
 import feedparser
-from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .base import BaseCollector, NewsItem
 
+_UTC = timezone.utc
+
+# 短文本去标签用的正则（比构建完整 DOM 快一个量级）
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# 36Kr 文章链接识别
+_ARTICLE_CLS_RE = re.compile(r"article|item|flow")
+_36KR_HREF_RE = re.compile(r"/p/\d+")
+
+# HTML 模式只查询 <a> 标签，解析时就把其余节点全部跳过
+_ANCHOR_ONLY = SoupStrainer("a")
+
+# 部分新闻站会拒绝非浏览器 UA，按请求覆盖共享客户端的默认头。
+# 模块级常量按引用复用，避免任何按调用的 dict 构造。
+_BROWSER_UA = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+_TECH_HEADERS = {"User-Agent": _BROWSER_UA}
+
 
 class TechNewsCollector(BaseCollector):
     """技术新闻站采集器，支持 RSS 和 HTML 模式。"""
@@ -34,42 +62,37 @@ class TechNewsCollector(BaseCollector):
 
     async def collect(self) -> list[NewsItem]:
         items: list[NewsItem] = []
+        self._seen_urls = set()
         news_config = self.kol_config.get("tech_news", {})
         sources = news_config.get("sources", [])
 
-        async with httpx.AsyncClient(
-            timeout=30,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                              "AppleWebKit/537.36 (KHTML, like Gecko) "
-                              "Chrome/120.0.0.0 Safari/537.36",
-            },
-            follow_redirects=True,
-        ) as client:
-            for source in sources:
-                try:
-                    source_type = source.get("type", "rss")
-                    if source_type == "rss":
-                        results = await self._collect_rss(client, source)
-                    else:
-                        results = await self._collect_html(client, source)
-                    items.extend(results)
-                    self.logger.debug(
-                        f"[{source['name']}] 采集到 {len(results)} 条"
-                    )
-                except Exception as e:
-                    self.logger.warning(f"采集 {source['name']} 失败: {e}")
-
-        # 去重 + 排序
-        seen: set[str] = set()
-        unique: list[NewsItem] = []
-        for item in items:
-            if item.url not in seen:
-                seen.add(item.url)
-                unique.append(item)
-
-        unique.sort(key=lambda x: x.published_at, reverse=True)
-        return unique[: self.max_items]
+        # 时间锚点只取一次，整轮采集复用
+        self._now = datetime.now(_UTC)
+        self._since = self._now - timedelta(days=self.lookback_days)
+
+        for source in sources:
+            try:
+                source_type = source.get("type", "rss")
+                if source_type == "rss":
+                    results = await self._collect_rss(self.http, source)
+                else:
+                    results = await self._collect_html(self.http, source)
+                items.extend(results)
+                self.logger.debug(
+                    "[%s] 采集到 %d 条", source["name"], len(results)
+                )
+            except Exception as e:
+                self.logger.warning(f"采集 {source['name']} 失败: {e}")
+
+        # 最新 top N（URL 去重已在采集时完成）
+        top = heapq.nlargest(
+            self.max_items, items, key=operator.attrgetter("published_at")
+        )
+
+        # 只为最终进入结果的条目打产品标签
+        for item in top:
+            self.tag_products(item)
+        return top
 
     async def _collect_rss(
         self, client: httpx.AsyncClient, source: dict
@@ -80,15 +103,23 @@ class TechNewsCollector(BaseCollector):
         source_name = source["name"]
         lang = source.get("language", "en")
 
-        resp = await client.get(feed_url)
+        resp = await client.get(feed_url, headers=_TECH_HEADERS)
         if resp.status_code != 200:
             self.logger.warning(f"RSS {source_name} 返回 {resp.status_code}")
             return items
 
-        feed = feedparser.parse(resp.text)
-        since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
+        # 优先走 lxml 快速解析（C 解析器）；异常结构交给 feedparser 兜底。
+        # feedparser 直接收 bytes，让其自行处理编码，省掉一次 decode/encode。
+        entries = self._parse_feed_fast(resp.content)
+        if entries is None:
+            entries = feedparser.parse(resp.content).entries
+
+        for entry in entries[:30]:
+            # 时间过滤最便宜，放最前面：过期条目直接跳过 HTML 清理和关键词扫描
+            published_at = self._parse_feed_time(entry)
+            if published_at < self._since:
+                continue
 
-        for entry in feed.entries[:30]:
             title = entry.get("title", "")
             summary = entry.get("summary", "") or entry.get("description", "")
             content = entry.get("content", [{}])
@@ -100,14 +131,10 @@ class TechNewsCollector(BaseCollector):
             # 清理 HTML
             full_content = self._strip_html(full_content)
             full_text = f"{title} {full_content}"
+            full_text_lower = full_text.lower()
 
             # 关键词过滤
-            if not self.filter_by_keywords(full_text):
-                continue
-
-            # 时间过滤
-            published_at = self._parse_feed_time(entry)
-            if published_at < since:
+            if not self.filter_by_keywords(full_text, full_text_lower):
                 continue
 
             link = entry.get("link", "")
@@ -123,8 +150,7 @@ class TechNewsCollector(BaseCollector):
                 language=lang,
             )
 
-            self.tag_products(item)
-            items.append(item)
+            self._add_unique(item, items)
 
         return items
 
@@ -137,13 +163,13 @@ class TechNewsCollector(BaseCollector):
         source_name = source["name"]
         lang = source.get("language", "zh")
 
-        resp = await client.get(page_url)
+        resp = await client.get(page_url, headers=_TECH_HEADERS)
         if resp.status_code != 200:
             self.logger.warning(f"HTML {source_name} 返回 {resp.status_code}")
             return items
 
-        soup = BeautifulSoup(resp.text, "lxml")
-        since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
+        # 传 bytes 让 lxml 自行探测编码；只解析 <a> 节点
+        soup = BeautifulSoup(resp.content, "lxml", parse_only=_ANCHOR_ONLY)
 
         # 36Kr 文章列表解析
         if "36kr" in page_url:
@@ -161,9 +187,9 @@ class TechNewsCollector(BaseCollector):
         items: list[NewsItem] = []
 
         # 36Kr 的文章通常包含在特定的 CSS 类中
-        articles = soup.find_all("a", class_=re.compile(r"article|item|flow"))
+        articles = soup.find_all("a", class_=_ARTICLE_CLS_RE)
         if not articles:
-            articles = soup.find_all("a", href=re.compile(r"/p/\d+"))
+            articles = soup.find_all("a", href=_36KR_HREF_RE)
 
         for article in articles[:20]:
             title = article.get_text(strip=True)
@@ -183,13 +209,12 @@ class TechNewsCollector(BaseCollector):
                 content=title,
                 source=self.source_name,
                 url=href,
-                published_at=datetime.now(timezone.utc),
+                published_at=self._now,
                 author=source_name,
                 language=lang,
             )
 
-            self.tag_products(item)
-            items.append(item)
+            self._add_unique(item, items)
 
         return items
 
@@ -222,54 +247,104 @@ class TechNewsCollector(BaseCollector):
                 content=text,
                 source=self.source_name,
                 url=href,
-                published_at=datetime.now(timezone.utc),
+                published_at=self._now,
                 author=source_name,
                 language=lang,
             )
 
-            self.tag_products(item)
-            items.append(item)
+            self._add_unique(item, items)
 
         return items
 
     # ===== 工具方法 =====
 
+    @staticmethod
+    def _parse_feed_fast(content: bytes) -> list[dict] | None:
+        """
+        用 lxml 直接解析 RSS/Atom feed，返回与 feedparser 条目同键名的 dict 列表。
+
+        只提取下游用到的字段（title/summary/link/author/published），
+        避免 feedparser 基于 sgmllib 的慢速全量解析。
+        无法识别的结构返回 None，由调用方退回 feedparser。
+        """
+        try:
+            root = lxml.etree.fromstring(content)
+        except lxml.etree.XMLSyntaxError:
+            return None
+
+        tag = lxml.etree.QName(root).localname.lower()
+        entries: list[dict] = []
+
+        if tag == "rss":
+            for node in root.iterfind(".//item"):
+                entries.append({
+                    "title": node.findtext("title", "") or "",
+                    "summary": node.findtext("description", "") or "",
+                    "link": node.findtext("link", "") or "",
+                    "author": node.findtext("author", "") or "",
+                    "published": node.findtext("pubDate", "") or "",
+                })
+        elif tag == "feed":
+            ns = {"a": "http://www.w3.org/2005/Atom"}
+            for node in root.iterfind("a:entry", ns):
+                link_node = node.find("a:link", ns)
+                entries.append({
+                    "title": node.findtext("a:title", "", ns) or "",
+                    "summary": node.findtext("a:summary", "", ns)
+                    or node.findtext("a:content", "", ns) or "",
+                    "link": link_node.get("href", "") if link_node is not None else "",
+                    "author": node.findtext("a:author/a:name", "", ns) or "",
+                    "published": node.findtext("a:published", "", ns)
+                    or node.findtext("a:updated", "", ns) or "",
+                })
+        else:
+            # RDF 等少见格式交给 feedparser
+            return None
+
+        return entries
+
     @staticmethod
     def _strip_html(html_text: str) -> str:
-        """移除 HTML 标签。"""
+        """移除 HTML 标签，提取纯文本。
+
+        此方法在 RSS 解析循环中每条都会调用：
+        - 不含标签的纯文本直接返回；
+        - 短摘要走正则去标签（避免任何 DOM 构建）；
+        - 长内容用 lxml 的 C 解析器提取文本。
+        """
         if not html_text:
             return ""
-        soup = BeautifulSoup(html_text, "lxml")
-        return soup.get_text(separator=" ", strip=True)
+        if "<" not in html_text:
+            return html_text.strip()
+        if len(html_text) < 512:
+            text = html.unescape(_TAG_RE.sub(" ", html_text))
+            return _WS_RE.sub(" ", text).strip()
+        try:
+            return lxml.html.fromstring(html_text).text_content().strip()
+        except Exception:
+            # 残缺 HTML 时退回正则
+            text = html.unescape(_TAG_RE.sub(" ", html_text))
+            return _WS_RE.sub(" ", text).strip()
 
     @staticmethod
     def _parse_feed_time(entry) -> datetime:
-        """解析 RSS feed 条目的发布时间。"""
-        # 优先用 published_parsed
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
-            from time import mktime
-            try:
-                return datetime.fromtimestamp(
-                    mktime(entry.published_parsed), tz=timezone.utc
-                )
-            except (OverflowError, ValueError, OSError):
-                pass
-
-        # 尝试 updated_parsed
-        if hasattr(entry, "updated_parsed") and entry.updated_parsed:
-            from time import mktime
-            try:
-                return datetime.fromtimestamp(
-                    mktime(entry.updated_parsed), tz=timezone.utc
-                )
-            except (OverflowError, ValueError, OSError):
-                pass
+        """解析 feed 条目的发布时间（兼容 feedparser 条目与快速路径的 dict）。"""
+        # 优先用 feedparser 预解析好的时间元组。
+        # 元组本身就是 UTC，timegm 直接转时间戳，
+        # 不像 mktime 先按本地时区解释再转回来。
+        for key in ("published_parsed", "updated_parsed"):
+            parsed = entry.get(key)
+            if parsed:
+                try:
+                    return datetime.fromtimestamp(timegm(parsed), tz=_UTC)
+                except (OverflowError, ValueError, OSError):
+                    pass
 
         # 尝试解析 published 字符串
-        published_str = getattr(entry, "published", "") or getattr(entry, "updated", "")
+        published_str = entry.get("published", "") or entry.get("updated", "")
         if published_str:
             try:
-                return parsedate_to_datetime(published_str).astimezone(timezone.utc)
+                return parsedate_to_datetime(published_str).astimezone(_UTC)
             except (ValueError, TypeError):
                 pass
             try:
@@ -279,4 +354,4 @@ class TechNewsCollector(BaseCollector):
             except (ValueError, AttributeError):
                 pass
 
-        return datetime.now(timezone.utc)
+        return datetime.now(_UTC)
@@ -10,17 +10,42 @@ KOL 推文优先级更高。
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import operator
 import os
+from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
 
 import httpx
+import orjson
 
 from .base import BaseCollector, NewsItem
 
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:  # aiolimiter 未安装时不限速
+    AsyncLimiter = None
+
+try:
+    import ciso8601
+except ImportError:  # ciso8601 未安装时退回 fromisoformat
+    ciso8601 = None
+
 
 class TwitterCollector(BaseCollector):
     """Twitter/X 采集器。"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # handle -> KOL 配置，解析推文时一次哈希查找代替逐 KOL 线性扫描
+        self._kol_by_handle = {
+            k["handle"].lower(): k for k in self.kol_config.get("twitter", [])
+        }
+
+        # Twitter v2 配额：搜索/时间线按 180 次 / 15 分钟限速
+        self._api_limiter = AsyncLimiter(180, 900) if AsyncLimiter else None
+
     @property
     def source_name(self) -> str:
         return "twitter"
@@ -28,6 +53,13 @@ class TwitterCollector(BaseCollector):
     async def collect(self) -> list[NewsItem]:
         bearer_token = os.getenv("TWITTER_BEARER_TOKEN", "")
 
+        # 互动量阈值每轮读一次，解析循环内直接用实例属性
+        self._min_engagement = (
+            self.settings.get("collection", {})
+            .get("min_engagement", {})
+            .get("twitter", 20)
+        )
+
         if bearer_token:
             return await self._collect_with_api(bearer_token)
         else:
@@ -46,23 +78,35 @@ class TwitterCollector(BaseCollector):
             "User-Agent": "Get-LLM-News/1.0",
         }
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            # 策略 1: 搜索关键词相关推文
-            items.extend(
-                await self._search_tweets(client, headers)
-            )
+        # 复用进程级共享客户端：跨数据源摊销 TCP+TLS 握手，
+        # api.twitter.com 支持 HTTP/2，gather 的并发请求在同一连接上多路复用
+        client = self.http
 
-            # 策略 2: 拉取 KOL 最新推文
-            for kol in twitter_kols[:15]:  # 限制 API 调用次数
-                try:
-                    kol_items = await self._get_kol_tweets(
-                        client, headers, kol
-                    )
-                    items.extend(kol_items)
-                except Exception as e:
-                    self.logger.warning(
-                        f"获取 @{kol['handle']} 推文失败: {e}"
-                    )
+        # 策略 1: 搜索关键词相关推文
+        items.extend(
+            await self._search_tweets(client, headers)
+        )
+
+        # 策略 2: 并发拉取 KOL 最新推文；信号量限流避免触发 429
+        kols = twitter_kols[:15]  # 限制 API 调用次数
+        sem = asyncio.Semaphore(8)
+
+        async def _bounded_fetch(kol: dict) -> list[NewsItem]:
+            async with sem:
+                return await self._get_kol_tweets(client, headers, kol)
+
+        results = await asyncio.gather(
+            *(_bounded_fetch(k) for k in kols),
+            return_exceptions=True,
+        )
+
+        for kol, result in zip(kols, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(
+                    f"获取 @{kol['handle']} 推文失败: {result}"
+                )
+            else:
+                items.extend(result)
 
         # 去重 + 排序
         return self._deduplicate_and_sort(items)
@@ -86,7 +130,7 @@ class TwitterCollector(BaseCollector):
             try:
                 params = {
                     "query": f"({query}) -is:retweet lang:en",
-                    "max_results": 20,
+                    "max_results": 100,
                     "start_time": since.strftime("%Y-%m-%dT%H:%M:%SZ"),
                     "tweet.fields": "created_at,public_metrics,author_id,lang",
                     "user.fields": "name,username",
@@ -94,72 +138,108 @@ class TwitterCollector(BaseCollector):
                     "sort_order": "relevancy",
                 }
 
-                resp = await client.get(
+                async for data in self._paginate(
+                    client,
                     "https://api.twitter.com/2/tweets/search/recent",
-                    headers=headers,
-                    params=params,
-                )
-
-                if resp.status_code != 200:
-                    self.logger.warning(f"Twitter 搜索返回 {resp.status_code}: {resp.text[:200]}")
-                    continue
-
-                data = resp.json()
-                users_map = self._build_users_map(data)
-
-                for tweet in data.get("data", []):
-                    item = self._parse_tweet(tweet, users_map)
-                    if item:
-                        items.append(item)
+                    params,
+                    headers,
+                ):
+                    users_map = self._build_users_map(data)
+                    for tweet in data.get("data", []):
+                        item = self._parse_tweet(tweet, users_map)
+                        if item:
+                            items.append(item)
 
             except Exception as e:
                 self.logger.warning(f"Twitter 搜索失败: {e}")
 
         return items
 
+    async def _stream_get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict,
+        headers: dict,
+    ) -> tuple[int, bytes]:
+        """流式拉取可能较大的响应体，返回 (状态码, 正文)。
+
+        max_results=100 加 expansions 的页面可达 ~200KB；stream + aread
+        按块读进单个缓冲，解析完立即释放，并发 gather 时不会同时持有
+        多份完整响应的中间拷贝。
+        """
+        async with (self._api_limiter or nullcontext()):
+            async with client.stream(
+                "GET", url, params=params, headers=headers
+            ) as resp:
+                body = await resp.aread()
+                return resp.status_code, body
+
+    async def _paginate(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: dict,
+        headers: dict,
+        max_pages: int = 3,
+    ):
+        """按 meta.next_token 翻页，逐页产出响应 JSON。
+
+        单页拉满 max_results=100（默认值的 5 倍），同样的推文量少发
+        5 倍请求；需要更深的结果集时继续翻页，最多 max_pages 页。
+        """
+        params = dict(params)
+        for _ in range(max_pages):
+            status, body = await self._stream_get(client, url, params, headers)
+            if status != 200:
+                self.logger.warning(
+                    f"Twitter 请求返回 {status}: {body[:200]!r}"
+                )
+                return
+            data = orjson.loads(body)
+            yield data
+            token = data.get("meta", {}).get("next_token")
+            if not token:
+                return
+            params["next_token"] = token
+
     async def _get_kol_tweets(
         self, client: httpx.AsyncClient, headers: dict, kol: dict
     ) -> list[NewsItem]:
-        """获取指定 KOL 的最新推文。"""
+        """获取指定 KOL 的最新推文。
+
+        用 search/recent 的 ``from:`` 查询一步拿到时间线，
+        handle -> user_id 的解析（连同落盘缓存）整个省掉，
+        每个 KOL 只花一次与搜索同配额的请求。
+        """
         items: list[NewsItem] = []
         handle = kol["handle"]
 
-        # 首先获取用户 ID
-        user_resp = await client.get(
-            f"https://api.twitter.com/2/users/by/username/{handle}",
-            headers=headers,
-        )
-
-        if user_resp.status_code != 200:
-            return items
-
-        user_data = user_resp.json().get("data", {})
-        user_id = user_data.get("id")
-        if not user_id:
-            return items
-
-        # 获取该用户的推文
+        # 单页 100 条已覆盖时间窗，不再翻页
         since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
         params = {
-            "max_results": 10,
+            "query": f"from:{handle} -is:retweet",
+            "max_results": 100,
             "start_time": since.strftime("%Y-%m-%dT%H:%M:%SZ"),
             "tweet.fields": "created_at,public_metrics,lang",
-            "exclude": "retweets",
         }
 
-        resp = await client.get(
-            f"https://api.twitter.com/2/users/{user_id}/tweets",
-            headers=headers,
-            params=params,
+        status, body = await self._stream_get(
+            client,
+            "https://api.twitter.com/2/tweets/search/recent",
+            params,
+            headers,
         )
 
-        if resp.status_code != 200:
+        if status != 200:
             return items
 
-        data = resp.json()
+        data = orjson.loads(body)
         for tweet in data.get("data", []):
             text = tweet.get("text", "")
-            if not self.filter_by_keywords(text):
+            # 过滤 + 打标签合并为一次自动机扫描
+            tags = self.scan_keywords(text)
+            if tags is None:
                 continue
 
             metrics = tweet.get("public_metrics", {})
@@ -171,6 +251,7 @@ class TwitterCollector(BaseCollector):
                 source=self.source_name,
                 url=f"https://twitter.com/{handle}/status/{tweet['id']}",
                 published_at=published_at,
+                external_id=int(tweet["id"]),
                 author=kol.get("name", handle),
                 author_handle=f"@{handle}",
                 engagement=metrics.get("like_count", 0),
@@ -180,7 +261,7 @@ class TwitterCollector(BaseCollector):
                 language=tweet.get("lang", "en"),
             )
 
-            self.tag_products(item)
+            item.tags = tags
             items.append(item)
 
         return items
@@ -216,37 +297,36 @@ class TwitterCollector(BaseCollector):
         self, tweet: dict, users_map: dict[str, dict]
     ) -> NewsItem | None:
         """解析单条推文为 NewsItem。"""
-        text = tweet.get("text", "")
-        if not self.filter_by_keywords(text):
+        # 局部别名省掉每字段一次的方法绑定（此函数按条调用）
+        get = tweet.get
+
+        # 上一轮运行已处理过的推文直接短路
+        if not self._is_new_id(get("id", "")):
             return None
 
-        metrics = tweet.get("public_metrics", {})
+        # 互动量筛选先行：整数比较远比关键词扫描便宜
+        metrics = get("public_metrics", {})
         likes = metrics.get("like_count", 0)
+        if likes < self._min_engagement:
+            return None
 
-        # 互动量筛选
-        min_engagement = (
-            self.settings.get("collection", {})
-            .get("min_engagement", {})
-            .get("twitter", 20)
-        )
-        if likes < min_engagement:
+        text = get("text", "")
+        # 过滤 + 打标签合并为一次自动机扫描
+        tags = self.scan_keywords(text)
+        if tags is None:
             return None
 
-        author_id = tweet.get("author_id", "")
+        author_id = get("author_id", "")
         user_info = users_map.get(author_id, {})
         username = user_info.get("username", "")
         author_name = user_info.get("name", username)
 
         # 检查是否为已知 KOL
-        is_kol = False
-        kol_tier = ""
-        for kol in self.kol_config.get("twitter", []):
-            if kol["handle"].lower() == username.lower():
-                is_kol = True
-                kol_tier = kol.get("tier", "B")
-                break
+        kol = self._kol_by_handle.get(username.lower())
+        is_kol = kol is not None
+        kol_tier = kol.get("tier", "B") if kol else ""
 
-        published_at = self._parse_twitter_time(tweet.get("created_at", ""))
+        published_at = self._parse_twitter_time(get("created_at", ""))
 
         item = NewsItem(
             title=text[:100],
@@ -254,32 +334,46 @@ class TwitterCollector(BaseCollector):
             source=self.source_name,
             url=f"https://twitter.com/{username}/status/{tweet['id']}",
             published_at=published_at,
+            external_id=int(tweet["id"]),
             author=author_name,
             author_handle=f"@{username}",
             engagement=likes,
             comments_count=metrics.get("reply_count", 0),
             is_kol=is_kol,
             kol_tier=kol_tier,
-            language=tweet.get("lang", "en"),
+            language=get("lang", "en"),
         )
 
-        self.tag_products(item)
+        item.tags = tags
         return item
 
     def _parse_twitter_time(self, time_str: str) -> datetime:
-        """解析 Twitter API 时间字符串。"""
+        """解析 Twitter API 时间字符串（RFC3339，每条推文一次）。"""
         try:
+            if ciso8601 is not None:
+                # C 扩展直接解析 RFC3339，比 fromisoformat 快一个量级
+                return ciso8601.parse_datetime(time_str)
             return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
         except (ValueError, AttributeError):
             return datetime.now(timezone.utc)
 
     def _deduplicate_and_sort(self, items: list[NewsItem]) -> list[NewsItem]:
-        """去重并按互动分排序。"""
-        seen: set[str] = set()
+        """去重并按互动分排序。
+
+        用推文的数字 ID 做集合键：int 哈希近乎免费，比 ~50 字符的
+        URL 字符串便宜得多，且同一条推文经搜索和 KOL 两条路径进来
+        也能对上。
+        """
+        # len 技巧：add 后看集合是否变大，每条只做一次哈希探测
+        seen: set[int | str | tuple] = set()
+        seen_add = seen.add
         unique: list[NewsItem] = []
         for item in items:
-            if item.url not in seen:
-                seen.add(item.url)
-                unique.append(item)
-        unique.sort(key=lambda x: x.engagement_score, reverse=True)
-        return unique[: self.max_items]
+            n = len(seen)
+            seen_add(item.external_id)
+            if len(seen) != n:
+                unique.append(item.finalize())
+        # O(n log k) 取 top N，代替整列排序后切片
+        return heapq.nlargest(
+            self.max_items, unique, key=operator.attrgetter("score")
+        )
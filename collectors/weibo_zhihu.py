@@ -13,18 +13,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import operator
 import os
 import json
+import re
 from datetime import datetime, timedelta, timezone
 
 import httpx
+import orjson
 
 from .base import BaseCollector, NewsItem
 
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:  # aiolimiter 未安装时不限速
+    AsyncLimiter = None
+
+# 微博正文去 HTML 用的正则
+_RE_HTML_TAG = re.compile(r"<[^>]+>")
+_RE_WS = re.compile(r"\s+")
+
+# 微博相对时间格式
+_RE_WEIBO_MIN = re.compile(r"(\d+)\s*分钟前")
+_RE_WEIBO_HOUR = re.compile(r"(\d+)\s*小时前")
+_RE_WEIBO_TODAY = re.compile(r"今天\s*(\d{1,2}):(\d{2})")
+_RE_WEIBO_YDAY = re.compile(r"昨天\s*(\d{1,2}):(\d{2})")
+_RE_WEIBO_YMD = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_RE_WEIBO_MD = re.compile(r"(\d{1,2})-(\d{1,2})")
+
 
 class WeiboZhihuCollector(BaseCollector):
     """微博/知乎采集器，使用 HTTP 请求 + Cookie 方式。"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 作者名 -> KOL 配置，解析帖子时用哈希查找代替逐 KOL 线性扫描
+        self._weibo_kol_by_name = {
+            k["name"]: k for k in self.kol_config.get("weibo", [])
+        }
+        self._zhihu_kol_by_name = {
+            a["name"]: a
+            for a in self.kol_config.get("zhihu", {}).get("authors", [])
+        }
+
+        # 移动端接口约 60 次/分钟，压在配额内避免整窗口收 429
+        self._weibo_limiter = AsyncLimiter(60, 60) if AsyncLimiter else None
+        self._zhihu_limiter = AsyncLimiter(60, 60) if AsyncLimiter else None
+
     @property
     def source_name(self) -> str:
         return "weibo_zhihu"
@@ -32,6 +69,14 @@ class WeiboZhihuCollector(BaseCollector):
     async def collect(self) -> list[NewsItem]:
         items: list[NewsItem] = []
 
+        # 阈值和时间锚点每轮算一次，解析循环内直接用实例属性；
+        # 单轮采集内的时钟漂移可以忽略
+        min_cfg = self.settings.get("collection", {}).get("min_engagement", {})
+        self._min_weibo = min_cfg.get("weibo", 50)
+        self._min_zhihu = min_cfg.get("zhihu", 10)
+        self._now = datetime.now(timezone.utc)
+        self._since = self._now - timedelta(days=self.lookback_days)
+
         # 微博采集
         weibo_items = await self._collect_weibo()
         items.extend(weibo_items)
@@ -40,9 +85,21 @@ class WeiboZhihuCollector(BaseCollector):
         zhihu_items = await self._collect_zhihu()
         items.extend(zhihu_items)
 
-        # 排序
-        items.sort(key=lambda x: x.engagement_score, reverse=True)
-        return items[: self.max_items]
+        # 按平台原生 ID 去重（同一条微博可能经多个关键词搜索进来）；
+        # len 技巧让每条只做一次哈希探测
+        seen: set[int | str | tuple] = set()
+        seen_add = seen.add
+        unique: list[NewsItem] = []
+        for item in items:
+            n = len(seen)
+            seen_add(item.external_id)
+            if len(seen) != n:
+                unique.append(item.finalize())
+
+        # O(n log k) 取 top N，代替整列排序后切片
+        return heapq.nlargest(
+            self.max_items, unique, key=operator.attrgetter("score")
+        )
 
     # ===== 微博 =====
 
@@ -64,33 +121,43 @@ class WeiboZhihuCollector(BaseCollector):
         if weibo_cookie:
             headers["Cookie"] = weibo_cookie
 
-        async with httpx.AsyncClient(
-            timeout=30, headers=headers, follow_redirects=True
-        ) as client:
-            # 策略 1: 按关键词搜索微博
-            for keyword in self.keywords[:8]:
-                try:
-                    results = await self._search_weibo(client, keyword)
-                    items.extend(results)
-                except Exception as e:
-                    self.logger.warning(f"微博搜索 '{keyword}' 失败: {e}")
-
-            # 策略 2: 采集 KOL 微博
-            weibo_kols = self.kol_config.get("weibo", [])
-            for kol in weibo_kols:
-                if kol.get("uid"):
-                    try:
-                        kol_items = await self._get_weibo_kol(client, kol)
-                        items.extend(kol_items)
-                    except Exception as e:
-                        self.logger.warning(
-                            f"采集微博 KOL {kol['name']} 失败: {e}"
-                        )
+        # 复用进程级共享客户端（HTTP/2），Cookie/UA 按请求传入
+        client = self.http
+
+        # 关键词搜索和 KOL 拉取互相独立，并发执行；
+        # 微博对高频访问较敏感，信号量压到 4 路
+        sem = asyncio.Semaphore(4)
+
+        async def _bounded_search(keyword: str) -> list[NewsItem]:
+            async with sem:
+                return await self._search_weibo(client, headers, keyword)
+
+        async def _bounded_kol(kol: dict) -> list[NewsItem]:
+            async with sem:
+                return await self._get_weibo_kol(client, headers, kol)
+
+        keywords = self.keywords[:8]
+        kols = [k for k in self.kol_config.get("weibo", []) if k.get("uid")]
+
+        results = await asyncio.gather(
+            *(_bounded_search(kw) for kw in keywords),
+            *(_bounded_kol(k) for k in kols),
+            return_exceptions=True,
+        )
+
+        labels = [f"微博搜索 '{kw}'" for kw in keywords] + [
+            f"采集微博 KOL {k['name']}" for k in kols
+        ]
+        for label, result in zip(labels, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"{label} 失败: {result}")
+            else:
+                items.extend(result)
 
         return items
 
     async def _search_weibo(
-        self, client: httpx.AsyncClient, keyword: str
+        self, client: httpx.AsyncClient, headers: dict, keyword: str
     ) -> list[NewsItem]:
         """通过微博移动端搜索 API 搜索关键词。"""
         items: list[NewsItem] = []
@@ -102,15 +169,18 @@ class WeiboZhihuCollector(BaseCollector):
         }
 
         try:
-            resp = await client.get(
+            resp = await self._limited_get(
+                client,
                 "https://m.weibo.cn/api/container/getIndex",
+                self._weibo_limiter,
                 params=params,
+                headers=headers,
             )
 
             if resp.status_code != 200:
                 return items
 
-            data = resp.json()
+            data = orjson.loads(resp.content)
             cards = data.get("data", {}).get("cards", [])
 
             for card in cards:
@@ -123,12 +193,12 @@ class WeiboZhihuCollector(BaseCollector):
                     items.append(item)
 
         except Exception as e:
-            self.logger.debug(f"微博搜索失败: {e}")
+            self.logger.debug("微博搜索失败: %s", e)
 
         return items
 
     async def _get_weibo_kol(
-        self, client: httpx.AsyncClient, kol: dict
+        self, client: httpx.AsyncClient, headers: dict, kol: dict
     ) -> list[NewsItem]:
         """获取指定 KOL 的最新微博。"""
         items: list[NewsItem] = []
@@ -140,15 +210,18 @@ class WeiboZhihuCollector(BaseCollector):
         }
 
         try:
-            resp = await client.get(
+            resp = await self._limited_get(
+                client,
                 "https://m.weibo.cn/api/container/getIndex",
+                self._weibo_limiter,
                 params=params,
+                headers=headers,
             )
 
             if resp.status_code != 200:
                 return items
 
-            data = resp.json()
+            data = orjson.loads(resp.content)
             cards = data.get("data", {}).get("cards", [])
 
             for card in cards:
@@ -156,14 +229,20 @@ class WeiboZhihuCollector(BaseCollector):
                     continue
 
                 mblog = card.get("mblog", {})
-                text = self._clean_weibo_html(mblog.get("text", ""))
-
-                if not self.filter_by_keywords(text):
+                raw_text = mblog.get("text", "")
+                if not raw_text:
                     continue
 
+                # 时间窗先行，过期帖子跳过 HTML 清理和关键词扫描
                 created_at = self._parse_weibo_time(mblog.get("created_at", ""))
-                since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
-                if created_at < since:
+                if created_at < self._since:
+                    continue
+
+                text = self._clean_weibo_html(raw_text)
+
+                # 过滤 + 打标签合并为一次自动机扫描
+                tags = self.scan_keywords(text)
+                if tags is None:
                     continue
 
                 reposts = mblog.get("reposts_count", 0)
@@ -176,6 +255,7 @@ class WeiboZhihuCollector(BaseCollector):
                     source="weibo",
                     url=f"https://m.weibo.cn/detail/{mblog.get('id', '')}",
                     published_at=created_at,
+                    external_id=int(mblog.get("id", 0) or 0),
                     author=kol["name"],
                     author_handle=f"uid:{uid}",
                     engagement=attitudes + reposts,
@@ -185,56 +265,61 @@ class WeiboZhihuCollector(BaseCollector):
                     language="zh",
                 )
 
-                self.tag_products(item)
+                item.tags = tags
                 items.append(item)
 
         except Exception as e:
-            self.logger.debug(f"获取微博 KOL {kol['name']} 失败: {e}")
+            self.logger.debug("获取微博 KOL %s 失败: %s", kol["name"], e)
 
         return items
 
     def _parse_weibo_post(self, mblog: dict) -> NewsItem | None:
         """解析微博帖子。"""
-        text = self._clean_weibo_html(mblog.get("text", ""))
+        # 局部别名省掉每字段一次的方法绑定（此函数按条调用）
+        get = mblog.get
 
-        if not self.filter_by_keywords(text):
+        # 上一轮运行已处理过的微博直接短路
+        if not self._is_new_id(get("id", "")):
             return None
 
-        reposts = mblog.get("reposts_count", 0)
-        comments = mblog.get("comments_count", 0)
-        attitudes = mblog.get("attitudes_count", 0)
+        raw_text = get("text", "")
+        if not raw_text:
+            return None
 
-        min_engagement = (
-            self.settings.get("collection", {})
-            .get("min_engagement", {})
-            .get("weibo", 50)
-        )
-        if (attitudes + reposts) < min_engagement:
+        # 互动量 / 时间窗筛选先行：整数比较和时间解析都比
+        # HTML 清理 + 关键词扫描便宜，不达标的帖子直接跳过
+        reposts = get("reposts_count", 0)
+        comments = get("comments_count", 0)
+        attitudes = get("attitudes_count", 0)
+        if (attitudes + reposts) < self._min_weibo:
+            return None
+
+        created_at = self._parse_weibo_time(get("created_at", ""))
+        if created_at < self._since:
             return None
 
-        created_at = self._parse_weibo_time(mblog.get("created_at", ""))
-        since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
-        if created_at < since:
+        text = self._clean_weibo_html(raw_text)
+
+        # 过滤 + 打标签合并为一次自动机扫描
+        tags = self.scan_keywords(text)
+        if tags is None:
             return None
 
-        user = mblog.get("user", {})
+        user = get("user") or {}
         author_name = user.get("screen_name", "")
 
         # 检查是否为已知 KOL
-        is_kol = False
-        kol_tier = ""
-        for kol in self.kol_config.get("weibo", []):
-            if kol["name"] == author_name:
-                is_kol = True
-                kol_tier = kol.get("tier", "B")
-                break
+        kol = self._weibo_kol_by_name.get(author_name)
+        is_kol = kol is not None
+        kol_tier = kol.get("tier", "B") if kol else ""
 
         item = NewsItem(
             title=text[:100],
             content=text[:2000],
             source="weibo",
-            url=f"https://m.weibo.cn/detail/{mblog.get('id', '')}",
+            url=f"https://m.weibo.cn/detail/{get('id', '')}",
             published_at=created_at,
+            external_id=int(get("id", 0) or 0),
             author=author_name,
             author_handle=f"uid:{user.get('id', '')}",
             engagement=attitudes + reposts,
@@ -244,7 +329,7 @@ class WeiboZhihuCollector(BaseCollector):
             language="zh",
         )
 
-        self.tag_products(item)
+        item.tags = tags
         return item
 
     # ===== 知乎 =====
@@ -266,22 +351,31 @@ class WeiboZhihuCollector(BaseCollector):
         zhihu_config = self.kol_config.get("zhihu", {})
         topics = zhihu_config.get("topics", [])
 
-        # 使用知乎搜索 API
-        async with httpx.AsyncClient(
-            timeout=30, headers=headers, follow_redirects=True
-        ) as client:
-            search_keywords = topics + self.keywords[:5]
-            for keyword in search_keywords[:10]:
-                try:
-                    results = await self._search_zhihu(client, keyword)
-                    items.extend(results)
-                except Exception as e:
-                    self.logger.warning(f"知乎搜索 '{keyword}' 失败: {e}")
+        # 使用知乎搜索 API（共享客户端，Cookie/UA 按请求传入），
+        # 关键词搜索并发执行
+        client = self.http
+        search_keywords = (topics + self.keywords[:5])[:10]
+        sem = asyncio.Semaphore(4)
+
+        async def _bounded_search(keyword: str) -> list[NewsItem]:
+            async with sem:
+                return await self._search_zhihu(client, headers, keyword)
+
+        results = await asyncio.gather(
+            *(_bounded_search(kw) for kw in search_keywords),
+            return_exceptions=True,
+        )
+
+        for keyword, result in zip(search_keywords, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"知乎搜索 '{keyword}' 失败: {result}")
+            else:
+                items.extend(result)
 
         return items
 
     async def _search_zhihu(
-        self, client: httpx.AsyncClient, keyword: str
+        self, client: httpx.AsyncClient, headers: dict, keyword: str
     ) -> list[NewsItem]:
         """搜索知乎内容。"""
         items: list[NewsItem] = []
@@ -294,16 +388,19 @@ class WeiboZhihuCollector(BaseCollector):
         }
 
         try:
-            resp = await client.get(
+            resp = await self._limited_get(
+                client,
                 "https://www.zhihu.com/api/v4/search_v3",
+                self._zhihu_limiter,
                 params=params,
+                headers=headers,
             )
 
             if resp.status_code != 200:
-                self.logger.debug(f"知乎搜索返回 {resp.status_code}")
+                self.logger.debug("知乎搜索返回 %d", resp.status_code)
                 return items
 
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             for result in data.get("data", []):
                 obj = result.get("object", {})
@@ -312,49 +409,50 @@ class WeiboZhihuCollector(BaseCollector):
                 if obj_type not in ("answer", "article", "zvideo"):
                     continue
 
-                title = obj.get("question", {}).get("name", "") or obj.get("title", "")
-                content = obj.get("excerpt", "") or obj.get("content", "")[:500]
-                full_text = f"{title} {content}"
+                # 局部别名省掉每字段一次的方法绑定
+                get = obj.get
 
-                if not self.filter_by_keywords(full_text):
+                # 上一轮运行已处理过的内容直接短路
+                if not self._is_new_id(f"{obj_type}:{get('id', '')}"):
                     continue
 
-                voteup = obj.get("voteup_count", 0)
-                min_engagement = (
-                    self.settings.get("collection", {})
-                    .get("min_engagement", {})
-                    .get("zhihu", 10)
-                )
-                if voteup < min_engagement:
+                # 赞同数筛选先行：整数比较远比关键词扫描便宜
+                voteup = get("voteup_count", 0)
+                if voteup < self._min_zhihu:
+                    continue
+
+                title = get("question", {}).get("name", "") or get("title", "")
+                content = get("excerpt", "") or get("content", "")[:500]
+                full_text = f"{title} {content}"
+
+                # 过滤 + 打标签合并为一次自动机扫描
+                tags = self.scan_keywords(full_text)
+                if tags is None:
                     continue
 
                 # 构建 URL
                 if obj_type == "answer":
-                    question_id = obj.get("question", {}).get("id", "")
-                    answer_id = obj.get("id", "")
+                    question_id = get("question", {}).get("id", "")
+                    answer_id = get("id", "")
                     url = f"https://www.zhihu.com/question/{question_id}/answer/{answer_id}"
                 elif obj_type == "article":
-                    url = f"https://zhuanlan.zhihu.com/p/{obj.get('id', '')}"
+                    url = f"https://zhuanlan.zhihu.com/p/{get('id', '')}"
                 else:
-                    url = obj.get("url", "")
+                    url = get("url", "")
 
-                author = obj.get("author", {})
+                author = get("author") or {}
                 author_name = author.get("name", "")
 
                 # 检查 KOL
-                is_kol = False
-                kol_tier = ""
-                for known_author in self.kol_config.get("zhihu", {}).get("authors", []):
-                    if known_author["name"] == author_name:
-                        is_kol = True
-                        kol_tier = known_author.get("tier", "B")
-                        break
-
-                created_time = obj.get("created_time", 0) or obj.get("created", 0)
+                known_author = self._zhihu_kol_by_name.get(author_name)
+                is_kol = known_author is not None
+                kol_tier = known_author.get("tier", "B") if known_author else ""
+
+                created_time = get("created_time", 0) or get("created", 0)
                 if created_time:
                     published_at = datetime.fromtimestamp(created_time, tz=timezone.utc)
                 else:
-                    published_at = datetime.now(timezone.utc)
+                    published_at = self._now
 
                 item = NewsItem(
                     title=title[:200] if title else content[:100],
@@ -362,19 +460,21 @@ class WeiboZhihuCollector(BaseCollector):
                     source="zhihu",
                     url=url,
                     published_at=published_at,
+                    # 知乎 answer/article 的 ID 会跨类型撞号，带上类型成对去重
+                    external_id=(obj_type, get("id", "")),
                     author=author_name,
                     engagement=voteup,
-                    comments_count=obj.get("comment_count", 0),
+                    comments_count=get("comment_count", 0),
                     is_kol=is_kol,
                     kol_tier=kol_tier,
                     language="zh",
                 )
 
-                self.tag_products(item)
+                item.tags = tags
                 items.append(item)
 
         except Exception as e:
-            self.logger.debug(f"知乎搜索解析失败: {e}")
+            self.logger.debug("知乎搜索解析失败: %s", e)
 
         return items
 
@@ -383,18 +483,19 @@ class WeiboZhihuCollector(BaseCollector):
     @staticmethod
     def _clean_weibo_html(html_text: str) -> str:
         """清理微博 HTML 标签，提取纯文本。"""
-        import re
         # 移除 HTML 标签
-        text = re.sub(r"<[^>]+>", "", html_text)
+        text = _RE_HTML_TAG.sub("", html_text)
         # 移除多余空白
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _RE_WS.sub(" ", text).strip()
         return text
 
-    @staticmethod
-    def _parse_weibo_time(time_str: str) -> datetime:
-        """解析微博时间字符串（如 '刚刚', '5分钟前', '今天 10:00'）。"""
-        import re
-        now = datetime.now(timezone.utc)
+    def _parse_weibo_time(self, time_str: str) -> datetime:
+        """解析微博时间字符串（如 '刚刚', '5分钟前', '今天 10:00'）。
+
+        相对时间基于 collect() 缓存的 self._now 换算，
+        不再每个时间戳都取一次系统时钟。
+        """
+        now = self._now
 
         if not time_str:
             return now
@@ -403,28 +504,28 @@ class WeiboZhihuCollector(BaseCollector):
             return now
 
         # X分钟前
-        m = re.search(r"(\d+)\s*分钟前", time_str)
+        m = _RE_WEIBO_MIN.search(time_str)
         if m:
             return now - timedelta(minutes=int(m.group(1)))
 
         # X小时前
-        m = re.search(r"(\d+)\s*小时前", time_str)
+        m = _RE_WEIBO_HOUR.search(time_str)
         if m:
             return now - timedelta(hours=int(m.group(1)))
 
         # 今天 HH:MM
-        m = re.search(r"今天\s*(\d{1,2}):(\d{2})", time_str)
+        m = _RE_WEIBO_TODAY.search(time_str)
         if m:
             return now.replace(hour=int(m.group(1)), minute=int(m.group(2)))
 
         # 昨天 HH:MM
-        m = re.search(r"昨天\s*(\d{1,2}):(\d{2})", time_str)
+        m = _RE_WEIBO_YDAY.search(time_str)
         if m:
             yesterday = now - timedelta(days=1)
             return yesterday.replace(hour=int(m.group(1)), minute=int(m.group(2)))
 
         # MM-DD 或 YYYY-MM-DD
-        m = re.search(r"(\d{4})-(\d{1,2})-(\d{1,2})", time_str)
+        m = _RE_WEIBO_YMD.search(time_str)
         if m:
             try:
                 return datetime(
@@ -434,7 +535,7 @@ class WeiboZhihuCollector(BaseCollector):
             except ValueError:
                 pass
 
-        m = re.search(r"(\d{1,2})-(\d{1,2})", time_str)
+        m = _RE_WEIBO_MD.search(time_str)
         if m:
             try:
                 return datetime(
@@ -27,7 +27,14 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from collectors.base import load_settings, load_kol_list, NewsItem
+from collectors.base import (
+    load_settings,
+    load_kol_list,
+    NewsItem,
+    get_http_client,
+    aclose_http_client,
+    save_seen_ids,
+)
 from collectors.hackernews import HackerNewsCollector
 from collectors.reddit import RedditCollector
 from collectors.twitter import TwitterCollector
@@ -53,13 +60,21 @@ ALL_SOURCES = list(COLLECTOR_MAP.keys())
 
 def setup_logging(level: str = "INFO") -> None:
     """配置日志。"""
-    from rich.logging import RichHandler
+    # 交互终端用 Rich 富文本；重定向 / CI 场景退回普通
+    # StreamHandler，省掉每条记录的富文本渲染开销
+    handler: logging.Handler
+    if sys.stderr.isatty():
+        from rich.logging import RichHandler
+
+        handler = RichHandler(rich_tracebacks=True, show_path=False)
+    else:
+        handler = logging.StreamHandler()
 
     logging.basicConfig(
         level=getattr(logging, level.upper(), logging.INFO),
         format="%(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(rich_tracebacks=True, show_path=False)],
+        handlers=[handler],
     )
 
 
@@ -99,13 +114,19 @@ async def run_pipeline(
 
     # ===== 2. 初始化采集器 =====
     logger.info(f"🔧 初始化采集器: {', '.join(sources)}")
+
+    # 共享 HTTP 客户端显式注入所有采集器；连接池上限
+    # 即全部数据源合计的在途请求上限
+    max_concurrency = settings.get("collection", {}).get("max_concurrency", 64)
+    http_client = get_http_client(max_concurrency)
+
     collectors = []
     for source_name in sources:
         if source_name not in COLLECTOR_MAP:
             logger.warning(f"未知数据源: {source_name}，跳过")
             continue
         collector_cls = COLLECTOR_MAP[source_name]
-        collectors.append(collector_cls(settings, kol_config))
+        collectors.append(collector_cls(settings, kol_config, http_client=http_client))
 
     if not collectors:
         logger.error("没有有效的采集器，退出")
@@ -113,8 +134,14 @@ async def run_pipeline(
 
     # ===== 3. 并行采集 =====
     logger.info("🚀 开始采集数据...")
-    tasks = [c.safe_collect() for c in collectors]
-    results = await asyncio.gather(*tasks)
+    try:
+        tasks = [c.safe_collect() for c in collectors]
+        results = await asyncio.gather(*tasks)
+    finally:
+        # 所有采集器共享同一个 HTTP 客户端，采集结束后统一关闭
+        await aclose_http_client()
+        # 已见 ID 过滤器落盘，下一轮运行据此跳过重复内容
+        save_seen_ids()
 
     # 合并所有结果
     all_items: list[NewsItem] = []
@@ -140,12 +167,15 @@ async def run_pipeline(
     if not dry_run:
         logger.info("🤖 生成 LLM 智能摘要...")
         summarizer = Summarizer(settings)
-
-        # 生成逐条摘要
-        await summarizer.summarize_items(unique_items)
-
-        # 生成日报总结
-        daily_summary = await summarizer.generate_daily_summary(unique_items)
+        try:
+            # 生成逐条摘要
+            await summarizer.summarize_items(unique_items)
+
+            # 生成日报总结
+            daily_summary = await summarizer.generate_daily_summary(unique_items)
+        finally:
+            # LLM 客户端连接池随摘要阶段结束统一关闭
+            await summarizer.aclose()
         logger.info("✅ LLM 摘要生成完成")
     else:
         logger.info("⏭️ 跳过 LLM 摘要（dry-run 模式）")
@@ -170,12 +200,11 @@ def _print_summary_stats(items: list[NewsItem], logger: logging.Logger) -> None:
         return
 
     from collections import Counter
+    from itertools import chain
 
     source_counts = Counter(item.source for item in items)
-    product_counts: Counter = Counter()
-    for item in items:
-        for tag in item.tags:
-            product_counts[tag] += 1
+    # chain.from_iterable 把嵌套 tags 摊平后交给 Counter 的 C 实现计数
+    product_counts = Counter(chain.from_iterable(item.tags for item in items))
 
     kol_count = sum(1 for item in items if item.is_kol)
 
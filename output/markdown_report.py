@@ -60,7 +60,7 @@ REPORT_TEMPLATE = """\
 ## 📦 按产品分类
 
 {% for product, items in product_groups.items() %}
-### {{ product_emoji(product) }} {{ product }}（{{ items | length }} 条）
+### {{ product_emoji(product) }} {{ product }}（{{ product_counts[product] }} 条）
 
 {% for item in items[:10] %}
 {{ loop.index }}. {% if item.is_kol %}🌟 **[KOL]**{% endif %} **{{ item.title | truncate(120) }}**
@@ -96,7 +96,7 @@ _今日暂无 KOL 相关内容采集到。_
 ## 📰 按来源详情
 
 {% for source, items in source_groups.items() %}
-### {{ source_label(source) }}（{{ items | length }} 条）
+### {{ source_label(source) }}（{{ source_counts[source] }} 条）
 
 {% for item in items[:8] %}
 - {% if item.is_kol %}🌟{% endif %} [{{ item.title | truncate(80) }}]({{ item.url }}) — {{ item.author }} · 👍{{ item.engagement }}{% if item.summary %} — _{{ item.summary }}_{% endif %}
@@ -112,16 +112,16 @@ _今日暂无 KOL 相关内容采集到。_
 
 | 产品 | 提及次数 | 平均互动量 |
 |------|----------|------------|
-{% for product, items in product_groups.items() %}
-| {{ product }} | {{ items | length }} | {{ (items | map(attribute='engagement') | sum / items | length) | round(0) | int }} |
+{% for product in product_groups %}
+| {{ product }} | {{ product_counts[product] }} | {{ avg_engagement[product] }} |
 {% endfor %}
 
 ### 来源分布
 
 | 来源 | 条目数 |
 |------|--------|
-{% for source, items in source_groups.items() %}
-| {{ source_label(source) }} | {{ items | length }} |
+{% for source in source_groups %}
+| {{ source_label(source) }} | {{ source_counts[source] }} |
 {% endfor %}
 
 ---
@@ -139,13 +139,21 @@ class MarkdownReportGenerator:
         self.report_dir = PROJECT_ROOT / output_cfg.get("report_dir", "reports")
         self.filename_template = output_cfg.get("filename_template", "%Y-%m-%d.md")
 
-        # 设置 Jinja2 环境
-        self.env = Environment(loader=BaseLoader(), autoescape=False)
+        # 设置 Jinja2 环境（模板不会在运行中变化，关掉自动重载）
+        self.env = Environment(
+            loader=BaseLoader(),
+            autoescape=False,
+            cache_size=50,
+            auto_reload=False,
+        )
         self.env.globals["product_emoji"] = self._product_emoji
         self.env.globals["source_label"] = self._source_label
         self.env.globals["kol_tier_label"] = self._kol_tier_label
         self.env.filters["truncate"] = self._truncate
 
+        # 模板只编译一次，generate() 直接复用编译产物
+        self._template = self.env.from_string(REPORT_TEMPLATE)
+
     def generate(
         self,
         items: list[NewsItem],
@@ -166,18 +174,34 @@ class MarkdownReportGenerator:
         if not date:
             date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-        # 数据处理
+        # 渲染模板（__init__ 中已编译）
+        return self._template.render(**self._build_context(items, daily_summary, date))
+
+    def _build_context(
+        self, items: list[NewsItem], daily_summary: str, date: str
+    ) -> dict:
+        """构建模板渲染上下文（generate 与 save 共用）。"""
+        # 整体只排一次序，产品/来源分组和 KOL 列表都继承这一顺序
+        # （主流程传来的列表已有序，Timsort 对其近似 O(N)）
+        items = sort_by_engagement(items)
         product_groups = group_by_product(items)
         source_groups = group_by_source(items)
-        kol_items = sort_by_engagement(filter_kol_items(items))
+        kol_items = filter_kol_items(items)
 
         # 所有涉及的来源和产品
         sources = list(source_groups.keys())
         products = [p for p in product_groups.keys() if p != "未分类"]
 
-        # 渲染模板
-        template = self.env.from_string(REPORT_TEMPLATE)
-        report = template.render(
+        # 统计数字在 Python 侧一次算好，模板只做字典查表，
+        # 避免在 Jinja 解释器里跑 map/sum/length 过滤器链
+        product_counts = {p: len(group) for p, group in product_groups.items()}
+        avg_engagement = {
+            p: round(sum(it.engagement for it in group) / len(group))
+            for p, group in product_groups.items()
+        }
+        source_counts = {s: len(group) for s, group in source_groups.items()}
+
+        return dict(
             date=date,
             generated_at=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
             total_items=len(items),
@@ -187,11 +211,12 @@ class MarkdownReportGenerator:
             daily_summary=daily_summary or "_LLM 摘要未生成，请查看详细条目。_",
             product_groups=product_groups,
             source_groups=source_groups,
+            product_counts=product_counts,
+            avg_engagement=avg_engagement,
+            source_counts=source_counts,
             kol_items=kol_items,
         )
 
-        return report
-
     def save(
         self,
         items: list[NewsItem],
@@ -207,8 +232,6 @@ class MarkdownReportGenerator:
         if not date:
             date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-        report_content = self.generate(items, daily_summary, date)
-
         # 确保输出目录存在
         self.report_dir.mkdir(parents=True, exist_ok=True)
 
@@ -216,7 +239,9 @@ class MarkdownReportGenerator:
         filename = datetime.strptime(date, "%Y-%m-%d").strftime(self.filename_template)
         filepath = self.report_dir / filename
 
-        filepath.write_text(report_content, encoding="utf-8")
+        # 流式渲染直写文件：边生成边落盘，不在内存里攒完整报告字符串
+        ctx = self._build_context(items, daily_summary, date)
+        self._template.stream(**ctx).dump(str(filepath), encoding="utf-8")
         logger.info(f"日报已保存到: {filepath}")
 
         return filepath
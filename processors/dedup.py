@@ -11,10 +11,43 @@
 from __future__ import annotations
 
 import re
+import string
+from collections import defaultdict
 from difflib import SequenceMatcher
 
 from collectors.base import NewsItem
 
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # datasketch 未安装时退回逐对比较
+    MinHash = MinHashLSH = None
+
+try:
+    import mmh3
+except ImportError:  # mmh3 未安装时不走 SimHash 路径
+    mmh3 = None
+
+# MinHash 置换数：128 在准确率和单条构建成本间的常用平衡点
+_NUM_PERM = 128
+
+# 小语料走 SimHash：64 位指纹 + 汉明距离，单对比较只是一次
+# XOR+popcount；超过该规模后 O(N²) 的对数赶上来，换 LSH 索引
+_SIMHASH_MAX_ITEMS = 2000
+
+# 汉明距离阈值：64 位指纹差 3 位以内视为同一标题
+_SIMHASH_MAX_DIST = 3
+
+# ASCII 标点在 C 层面一次 translate 删除；
+# 其余非词字符（全角标点等）再走一次 Unicode 正则
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+# 标题规范化用的正则
+_RE_NONWORD = re.compile(r"[^\w\s\u4e00-\u9fff]")
+_RE_WS = re.compile(r"\s+")
+
+# URL 里常见的 tracking 参数（非捕获组，匹配时不构造 groups）
+_TRACKING_RE = re.compile(r"[?&](?:utm_\w+|ref|source|fbclid|gclid)=[^&]*")
+
 
 class Deduplicator:
     """新闻条目去重器。"""
@@ -65,28 +98,139 @@ class Deduplicator:
 
         # 按互动量降序排列，优先保留高互动量条目
         sorted_items = sorted(items, key=lambda x: x.engagement_score, reverse=True)
+
+        # 按规模选算法：典型报告量级（几百条）SimHash 每对比较近乎免费，
+        # 省掉 LSH 索引的构建成本；大语料换 LSH 摊平 O(N²)
+        if mmh3 is not None and len(sorted_items) < _SIMHASH_MAX_ITEMS:
+            return self._dedup_simhash(sorted_items)
+        if MinHashLSH is not None:
+            return self._dedup_minhash(sorted_items)
+        return self._dedup_pairwise(sorted_items)
+
+    def _dedup_simhash(self, sorted_items: list[NewsItem]) -> list[NewsItem]:
+        """SimHash 指纹去重：每条 8 字节指纹，单对比较一次 XOR+popcount。"""
         kept: list[NewsItem] = []
+        fingerprints: list[int] = []
+
+        for item in sorted_items:
+            fp = self._simhash(self._normalize_title(item.title))
+
+            duplicate_of = -1
+            for j, kept_fp in enumerate(fingerprints):
+                if (fp ^ kept_fp).bit_count() <= _SIMHASH_MAX_DIST:
+                    duplicate_of = j
+                    break
+
+            if duplicate_of >= 0:
+                kept_item = kept[duplicate_of]
+                for tag in item.tags:
+                    if tag not in kept_item.tags:
+                        kept_item.tags.append(tag)
+                continue
+
+            fingerprints.append(fp)
+            kept.append(item)
+
+        return kept
+
+    @staticmethod
+    def _simhash(text: str) -> int:
+        """计算 64 位 SimHash 指纹（字符 4-gram 特征）。"""
+        if len(text) < 4:
+            grams = [text] if text else []
+        else:
+            grams = [text[i : i + 4] for i in range(len(text) - 3)]
+
+        acc = [0] * 64
+        for gram in grams:
+            h = mmh3.hash64(gram, signed=False)[0]
+            for bit in range(64):
+                if (h >> bit) & 1:
+                    acc[bit] += 1
+                else:
+                    acc[bit] -= 1
+
+        fp = 0
+        for bit, weight in enumerate(acc):
+            if weight > 0:
+                fp |= 1 << bit
+        return fp
+
+    def _dedup_minhash(self, sorted_items: list[NewsItem]) -> list[NewsItem]:
+        """MinHash + 分桶 LSH 近似去重。
+
+        每条只与落在同一哈希桶的候选比较，总工作量 ~O(N)，
+        代替逐对 SequenceMatcher 的 O(N²) 动态规划比较。
+        """
+        lsh = MinHashLSH(
+            threshold=self.similarity_threshold, num_perm=_NUM_PERM
+        )
+        kept: list[NewsItem] = []
+
+        for item in sorted_items:
+            norm = self._normalize_title(item.title)
+            mh = MinHash(num_perm=_NUM_PERM)
+            # 字符 5-gram 特征，对中英文标题都适用
+            for i in range(max(len(norm) - 4, 1)):
+                mh.update(norm[i : i + 5].encode("utf-8"))
+
+            matches = lsh.query(mh)
+            if matches:
+                # 命中即视为重复：合并标签到最早保留（互动量最高）的那条
+                kept_item = kept[min(matches)]
+                for tag in item.tags:
+                    if tag not in kept_item.tags:
+                        kept_item.tags.append(tag)
+                continue
+
+            lsh.insert(len(kept), mh)
+            kept.append(item)
+
+        return kept
+
+    def _dedup_pairwise(self, sorted_items: list[NewsItem]) -> list[NewsItem]:
+        """逐对 SequenceMatcher 比较的降级路径（datasketch 未安装时）。
+
+        比较前先按 (长度桶, 8 字符前缀) 收窄候选：长度相差超过
+        一个桶宽或前缀不同的标题几乎不可能过相似度阈值，
+        直接跳过昂贵的动态规划比较。
+        """
+        kept: list[NewsItem] = []
+        # 已保留条目的规范化标题只算一次，
+        # 否则内层循环每轮都重跑两次正则替换
+        kept_norms: list[str] = []
+        # (len//8, 前缀) -> 已保留条目下标
+        buckets: defaultdict[tuple[int, str], list[int]] = defaultdict(list)
 
         for item in sorted_items:
-            is_duplicate = False
             normalized_title = self._normalize_title(item.title)
+            length_bucket = len(normalized_title) // 8
+            prefix = normalized_title[:8]
 
-            for kept_item in kept:
-                kept_title = self._normalize_title(kept_item.title)
+            # 相邻长度桶一并纳入，容忍 ±8 字符的长度抖动
+            candidates: list[int] = []
+            for lb in (length_bucket - 1, length_bucket, length_bucket + 1):
+                candidates.extend(buckets.get((lb, prefix), ()))
+
+            is_duplicate = False
+            for idx in candidates:
                 similarity = SequenceMatcher(
-                    None, normalized_title, kept_title
+                    None, normalized_title, kept_norms[idx]
                 ).ratio()
 
                 if similarity >= self.similarity_threshold:
                     is_duplicate = True
                     # 合并标签
+                    kept_item = kept[idx]
                     for tag in item.tags:
                         if tag not in kept_item.tags:
                             kept_item.tags.append(tag)
                     break
 
             if not is_duplicate:
+                buckets[(length_bucket, prefix)].append(len(kept))
                 kept.append(item)
+                kept_norms.append(normalized_title)
 
         return kept
 
@@ -94,23 +238,23 @@ class Deduplicator:
     def _normalize_url(url: str) -> str:
         """规范化 URL（去除 tracking 参数等）。"""
         # 移除常见的 tracking 参数
-        url = re.sub(r"[?&](utm_\w+|ref|source|fbclid|gclid)=[^&]*", "", url)
+        url = _TRACKING_RE.sub("", url)
+        # 统一 http/https（只看前缀，不全串替换）
+        if url.startswith("http://"):
+            url = "https://" + url[7:]
         # 移除尾部斜杠
-        url = url.rstrip("/")
-        # 统一 http/https
-        url = url.replace("http://", "https://")
-        return url
+        return url.rstrip("/")
 
     @staticmethod
     def _normalize_title(title: str) -> str:
         """规范化标题用于比较。"""
-        # 转小写
-        title = title.lower().strip()
-        # 移除特殊字符
-        title = re.sub(r"[^\w\s\u4e00-\u9fff]", "", title)
+        # 转小写 + 删 ASCII 标点（translate 为 C 实现，
+        # 英文为主的标题多数在此步就清理干净）
+        title = title.lower().translate(_PUNCT_TABLE)
+        # 残余的非词字符（全角标点、符号等）走 Unicode 正则
+        title = _RE_NONWORD.sub("", title)
         # 压缩空白
-        title = re.sub(r"\s+", " ", title)
-        return title
+        return _RE_WS.sub(" ", title).strip()
 
 
 def sort_by_engagement(items: list[NewsItem]) -> list[NewsItem]:
@@ -119,31 +263,31 @@ def sort_by_engagement(items: list[NewsItem]) -> list[NewsItem]:
 
 
 def group_by_product(items: list[NewsItem]) -> dict[str, list[NewsItem]]:
-    """按产品标签分组。"""
-    groups: dict[str, list[NewsItem]] = {}
+    """按产品标签分组，各组继承输入列表的顺序。
+
+    调用方传入已按互动量排序的列表即可让各组天然有序，
+    不在此处重复排序。
+    """
+    groups: defaultdict[str, list[NewsItem]] = defaultdict(list)
 
     for item in items:
         if not item.tags:
-            groups.setdefault("未分类", []).append(item)
+            groups["未分类"].append(item)
         else:
             for tag in item.tags:
-                groups.setdefault(tag, []).append(item)
-
-    # 每组内按互动量排序
-    for key in groups:
-        groups[key] = sort_by_engagement(groups[key])
+                groups[tag].append(item)
 
-    return groups
+    return dict(groups)
 
 
 def group_by_source(items: list[NewsItem]) -> dict[str, list[NewsItem]]:
-    """按数据来源分组。"""
-    groups: dict[str, list[NewsItem]] = {}
+    """按数据来源分组，各组继承输入列表的顺序。"""
+    groups: defaultdict[str, list[NewsItem]] = defaultdict(list)
 
     for item in items:
-        groups.setdefault(item.source, []).append(item)
+        groups[item.source].append(item)
 
-    return groups
+    return dict(groups)
 
 
 def filter_kol_items(items: list[NewsItem]) -> list[NewsItem]:
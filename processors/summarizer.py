@@ -12,11 +12,14 @@ LLM 智能摘要生成器。
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import os
+import re
 from datetime import datetime
 
+import orjson
+
 from collectors.base import NewsItem
 
 logger = logging.getLogger(__name__)
@@ -90,6 +93,8 @@ class Summarizer:
         self.openai_model = summarizer_cfg.get("openai_model", "gpt-4o")
         self.max_tokens = summarizer_cfg.get("max_tokens", 4096)
         self.temperature = summarizer_cfg.get("temperature", 0.3)
+        self.concurrency = summarizer_cfg.get("concurrency", 5)
+        self.batch_token_budget = summarizer_cfg.get("batch_token_budget", 6000)
 
         # Azure OpenAI 配置
         azure_cfg = summarizer_cfg.get("azure_openai", {})
@@ -100,6 +105,22 @@ class Summarizer:
             "AZURE_OPENAI_API_VERSION", azure_cfg.get("api_version", "2024-12-01-preview")
         )
 
+        # LLM 客户端按首次调用惰性创建后全程复用，
+        # 避免每次请求重建连接池 + TLS 握手
+        self._claude_client = None
+        self._azure_client = None
+        self._openai_client = None
+
+    async def aclose(self) -> None:
+        """关闭已创建的 LLM 客户端连接池。"""
+        for client in (self._claude_client, self._azure_client, self._openai_client):
+            if client is not None:
+                try:
+                    await client.close()
+                except Exception:
+                    pass
+        self._claude_client = self._azure_client = self._openai_client = None
+
     async def generate_daily_summary(self, items: list[NewsItem]) -> str:
         """
         生成日报摘要文本。
@@ -131,41 +152,73 @@ class Summarizer:
         if not items:
             return items
 
-        # 批量处理：将多条合并为一次 API 调用
-        batch_size = 10
-        for i in range(0, len(items), batch_size):
-            batch = items[i : i + batch_size]
-            await self._summarize_batch(batch)
+        # 批量处理：按估算 token 预算打包（短内容多装几条，长内容
+        # 少装），代替固定 10 条一批；各批相互独立，并发发出后
+        # 总耗时取决于最慢的一批而非各批之和
+        batches = self._pack_batches(items)
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _bounded_batch(batch: list[NewsItem]) -> None:
+            async with sem:
+                await self._summarize_batch(batch)
+
+        await asyncio.gather(*(_bounded_batch(b) for b in batches))
 
         return items
 
+    def _pack_batches(self, items: list[NewsItem]) -> list[list[NewsItem]]:
+        """按 token 预算把条目打包成批。
+
+        每条进入 prompt 的文本是 title[:200] + content[:300]，
+        按 ~3 字符/Token 粗估并加上条目模板的固定开销，
+        累计到 batch_token_budget 即封批。
+        """
+        batches: list[list[NewsItem]] = []
+        current: list[NewsItem] = []
+        current_tokens = 0
+
+        for item in items:
+            est_tokens = (len(item.title[:200]) + 300) // 3 + 40
+            if current and current_tokens + est_tokens > self.batch_token_budget:
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(item)
+            current_tokens += est_tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
     async def _summarize_batch(self, items: list[NewsItem]) -> None:
         """批量为一组条目生成摘要。"""
-        batch_prompt = "请为以下每条内容生成一句话中文摘要（不超过50字）和情感倾向判断。\n\n"
+        # 列表收集 + 一次 join，避免逐段 += 的反复重分配
+        parts = ["请为以下每条内容生成一句话中文摘要（不超过50字）和情感倾向判断。\n\n"]
 
         for idx, item in enumerate(items):
-            batch_prompt += f"## 条目 {idx + 1}\n"
-            batch_prompt += f"标题: {item.title[:200]}\n"
-            batch_prompt += f"内容: {item.content[:300]}\n"
-            batch_prompt += f"来源: {item.source}\n\n"
+            parts.append(
+                f"## 条目 {idx + 1}\n"
+                f"标题: {item.title[:200]}\n"
+                f"内容: {item.content[:300]}\n"
+                f"来源: {item.source}\n\n"
+            )
 
-        batch_prompt += (
+        parts.append(
             "\n请用 JSON 数组格式回复，每个元素包含 index, summary, sentiment 字段。\n"
             '例如: [{"index": 1, "summary": "摘要", "sentiment": "positive"}]\n'
             "只返回 JSON，不要其他文本。"
         )
+        batch_prompt = "".join(parts)
 
         try:
             response = await self._call_llm(batch_prompt)
-            # 尝试解析 JSON
-            # 移除可能的 markdown 代码块标记
-            clean_response = response.strip()
-            if clean_response.startswith("```"):
-                clean_response = clean_response.split("\n", 1)[-1]
-                if clean_response.endswith("```"):
-                    clean_response = clean_response[:-3]
+            # 直接提取首个 JSON 数组：模型偶尔带 markdown 围栏或前后说明文字，
+            # 正则取 [...] 块后交给 orjson 解析
+            match = re.search(r"\[.*\]", response, re.S)
+            if match is None:
+                raise ValueError("响应中未找到 JSON 数组")
 
-            results = json.loads(clean_response)
+            results = orjson.loads(match.group(0))
 
             for result in results:
                 idx = result.get("index", 0) - 1
@@ -173,7 +226,7 @@ class Summarizer:
                     items[idx].summary = result.get("summary", "")
                     items[idx].sentiment = result.get("sentiment", "neutral")
 
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (ValueError, KeyError, TypeError) as e:
             logger.warning(f"批量摘要解析失败: {e}")
             # 降级：设置默认值
             for item in items:
@@ -204,7 +257,27 @@ class Summarizer:
         try:
             import anthropic
 
-            client = anthropic.AsyncAnthropic(api_key=api_key)
+            if self._claude_client is None:
+                self._claude_client = anthropic.AsyncAnthropic(api_key=api_key)
+            client = self._claude_client
+
+            # 流式接收：边生成边累积文本，省掉等整段响应落地的空窗；
+            # 流式出错时回退一次性调用
+            try:
+                parts: list[str] = []
+                async with client.messages.stream(
+                    model=self.claude_model,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                ) as stream:
+                    async for text in stream.text_stream:
+                        parts.append(text)
+                return "".join(parts)
+            except Exception as stream_err:
+                logger.debug("Claude 流式调用失败，回退非流式: %s", stream_err)
 
             message = await client.messages.create(
                 model=self.claude_model,
@@ -233,11 +306,18 @@ class Summarizer:
         try:
             from openai import AsyncAzureOpenAI
 
-            client = AsyncAzureOpenAI(
-                azure_endpoint=self.azure_endpoint,
-                api_key=self.azure_api_key,
-                api_version=self.azure_api_version,
-            )
+            if self._azure_client is None:
+                self._azure_client = AsyncAzureOpenAI(
+                    azure_endpoint=self.azure_endpoint,
+                    api_key=self.azure_api_key,
+                    api_version=self.azure_api_version,
+                )
+            client = self._azure_client
+
+            try:
+                return await self._stream_chat_completion(client, self.azure_deployment, prompt)
+            except Exception as stream_err:
+                logger.debug("Azure OpenAI 流式调用失败，回退非流式: %s", stream_err)
 
             response = await client.chat.completions.create(
                 model=self.azure_deployment,
@@ -271,7 +351,14 @@ class Summarizer:
         try:
             from openai import AsyncOpenAI
 
-            client = AsyncOpenAI(api_key=api_key)
+            if self._openai_client is None:
+                self._openai_client = AsyncOpenAI(api_key=api_key)
+            client = self._openai_client
+
+            try:
+                return await self._stream_chat_completion(client, self.openai_model, prompt)
+            except Exception as stream_err:
+                logger.debug("OpenAI 流式调用失败，回退非流式: %s", stream_err)
 
             response = await client.chat.completions.create(
                 model=self.openai_model,
@@ -295,6 +382,31 @@ class Summarizer:
             logger.error(f"OpenAI API 调用失败: {e}")
             return await self._try_fallback_providers(prompt, exclude="openai")
 
+    async def _stream_chat_completion(self, client, model: str, prompt: str) -> str:
+        """以流式方式调用 Chat Completions API 并累积文本。
+
+        OpenAI 与 Azure OpenAI 共用同一 SDK 接口，
+        首个 token 到达即开始累积，不等整段响应落地。
+        """
+        parts: list[str] = []
+        stream = await client.chat.completions.create(
+            model=model,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "你是一个 AI 编程工具行业分析师，擅长从社交媒体和新闻中提炼关键信息。",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
     async def _try_fallback_providers(self, prompt: str, exclude: str = "") -> str:
         """按优先级尝试备用 LLM 提供商。"""
         fallback_order = ["azure_openai", "claude", "openai"]